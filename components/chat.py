@@ -2,31 +2,115 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 
-from llmling_agent.messaging.messages import ChatMessage
 import streamlit as st
 
 from components.state import state
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from llmling_agent import Agent
+    from llmling_agent.messaging.messages import ChatMessage
     from streamlit.delta_generator import DeltaGenerator
 
 
+def _stable_prefix_end(text: str, start: int = 0) -> int:
+    """Return the end of the last finished markdown block in text[start:].
+
+    A block is finished once it is followed by a blank line that is not part
+    of an open code fence. ``start`` must itself be a block boundary.
+    """
+    end = start
+    fence_open = False
+    idx = start
+    while (sep := text.find("\n\n", idx)) != -1:
+        if text.count("```", idx, sep) % 2:
+            fence_open = not fence_open
+        if not fence_open:
+            end = sep + 2
+        idx = sep + 2
+    return end
+
+
+async def _throttled_render(
+    stable: DeltaGenerator,
+    tail: DeltaGenerator,
+    chunks: AsyncIterator[str],
+    min_interval: float = 0.04,
+) -> None:
+    """Render streamed text incrementally, flushing at most every min_interval.
+
+    Each chunk is expected to contain the full accumulated text, so intermediate
+    chunks can be dropped safely. Finished blocks are written to ``stable`` once,
+    only the still growing tail is re-rendered into ``tail`` on every flush.
+    The latest text is always flushed at the end.
+
+    The source iterator is pumped into a queue by a separate task; the
+    renderer drains everything that arrived in the meantime at once and
+    only looks at the latest chunk of each batch.
+    """
+    queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for chunk in chunks:
+                queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(None)
+
+    committed = 0
+    last_text: str | None = None
+    last_flush = time.monotonic()
+    pending = False
+
+    def flush(text: str) -> None:
+        nonlocal committed
+        end = _stable_prefix_end(text, committed)
+        if end > committed:
+            stable.markdown(text[committed:end])
+            committed = end
+        tail.markdown(text[committed:])
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if texts := [chunk for chunk in batch if chunk is not None]:
+                last_text = texts[-1]
+                pending = True
+                now = time.monotonic()
+                if now - last_flush >= min_interval:
+                    flush(last_text)
+                    last_flush = now
+                    pending = False
+            if batch[-1] is None:
+                break
+        await pump_task  # Propagate errors from the source iterator
+    finally:
+        pump_task.cancel()
+        if pending and last_text is not None:
+            flush(last_text)
+
+
 async def stream_response(
     agent: Agent[None],
     prompt: str,
-    placeholder: DeltaGenerator,
+    container: DeltaGenerator,
 ) -> None:
     """Stream response and collect messages directly to state."""
+    stable = container.container()
+    tail = container.empty()
 
     # Function to collect messages directly to state
     async def collect_message(msg: ChatMessage) -> None:
-        messages = state.messages[agent.name]
-        if msg not in messages:
-            messages.append(msg)
+        state.add_message(agent.name, msg)
 
     # Connect to agent events
     agent.message_sent.connect(collect_message)
@@ -34,8 +118,7 @@ async def stream_response(
 
     try:
         async with agent.run_stream(prompt) as stream:
-            async for chunk in stream.stream():
-                placeholder.markdown(chunk)
+            await _throttled_render(stable, tail, stream.stream())
     finally:
         agent.message_sent.disconnect(collect_message)
         agent.message_received.disconnect(collect_message)
@@ -49,9 +132,7 @@ async def return_response(
 
     # Function to collect messages directly to state
     async def collect_message(msg: ChatMessage) -> None:
-        messages = state.messages[agent.name]
-        if msg not in messages:
-            messages.append(msg)
+        state.add_message(agent.name, msg)
 
     # Connect to agent events
     agent.message_sent.connect(collect_message)
@@ -66,29 +147,37 @@ async def return_response(
 
 def clear_chat_history(agent: Agent[None]) -> None:
     """Clear the chat history for a specific agent."""
-    state.messages[agent.name] = []
+    state.clear_agent_messages(agent.name)
 
 
-async def create_chat_ui(
+@st.fragment
+def create_chat_ui(
     agent: Agent[None],
     *,
     placeholder_text: str = "Ihre Frage...",
     thinking_text: str = "Denke nach...",
 ) -> None:
-    """Create a chat UI that integrates with page's session state."""
+    """Create a chat UI that integrates with page's session state.
+
+    The chat UI runs as a fragment, so new prompts and streamed responses only
+    rerun the chat itself instead of the whole page. Must not be called from
+    within a running event loop.
+    """
     # Get messages for this specific agent
     messages = state.messages[agent.name]
 
     # Display chat history
-    for message in messages:
+    for message in messages.values():
         with st.chat_message(message.role):
             st.markdown(message.content)
 
     # Chat input
     if prompt := st.chat_input(placeholder_text):
         # Add and display user message
+        from llmling_agent.messaging.messages import ChatMessage
+
         user_msg = ChatMessage(content=prompt, role="user")
-        messages.append(user_msg)
+        state.add_message(agent.name, user_msg)
 
         with st.chat_message("user"):
             st.markdown(prompt)
@@ -96,13 +185,15 @@ async def create_chat_ui(
         try:
             # Process message through agent
             with st.chat_message("assistant"):
-                message_placeholder = st.empty()
+                message_container = st.container()
                 # Stream the response - messages are collected directly to state
                 with st.spinner(thinking_text):
-                    await stream_response(
-                        agent=agent,
-                        prompt=prompt,
-                        placeholder=message_placeholder,
+                    asyncio.run(
+                        stream_response(
+                            agent=agent,
+                            prompt=prompt,
+                            container=message_container,
+                        )
                     )
 
         except Exception as e:  # noqa: BLE001
@@ -111,17 +202,11 @@ async def create_chat_ui(
 
 
 if __name__ == "__main__":
-    from llmling_agent import Agent
-
     from utils import run
 
-    async def demo():
-        await state.initialize()
-        agent = Agent[None](model="gpt-4o-mini", name="test_agent")
-        await agent.__aenter__()
-        try:
-            await create_chat_ui(agent)
-        finally:
-            await agent.__aexit__(None, None, None)
+    def demo():
+        if not state.initialized:
+            asyncio.run(state.initialize())
+        create_chat_ui(state.chat_agent)
 
-    run(demo())
+    run(demo)
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
-from llmling_agent.messaging.messages import ChatMessage
 import streamlit as st
 
 
 if TYPE_CHECKING:
     import types
 
+    from llmling_agent.messaging.messages import ChatMessage
     from streamlit.delta_generator import DeltaGenerator
 
 
@@ -29,28 +30,48 @@ def render_tool_call(container: DeltaGenerator | types.ModuleType, tool_call):
             st.markdown(f"*Execution time: {tool_call.timing:.2f}s*")
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_metadata(
+    model: str | None,
+    total_cost: float | None,
+    total_tokens: int | None,
+    response_time: float | None,
+) -> str:
+    """Format a message's metadata footer."""
+    metadata = []
+    if model:
+        metadata.append(f"Model: {model}")
+    if total_cost is not None:
+        metadata.append(f"Cost: ${total_cost:.4f}")
+    if total_tokens is not None:
+        metadata.append(f"Tokens: {total_tokens:,}")
+    if response_time:
+        metadata.append(f"Time: {response_time:.2f}s")
+    return " | ".join(metadata)
+
+
 def render_message_content(msg: ChatMessage[Any], container: DeltaGenerator):
     """Render a message's content with optional metadata."""
     # Main content
     container.markdown(str(msg.content))
 
     # Show tool calls in expanders
-    for tool_call in msg.tool_calls:
-        render_tool_call(container, tool_call)
+    if msg.tool_calls:
+        for tool_call in msg.tool_calls:
+            render_tool_call(container, tool_call)
 
     # Optional metadata footer
-    metadata = []
-    if msg.model:
-        metadata.append(f"Model: {msg.model}")
-    if msg.cost_info:
-        metadata.append(f"Cost: ${msg.cost_info.total_cost:.4f}")
-        metadata.append(f"Tokens: {msg.cost_info.token_usage['total']:,}")
-    if msg.response_time:
-        metadata.append(f"Time: {msg.response_time:.2f}s")
-
-    if metadata:
-        container.markdown("---")
-        container.markdown(" | ".join(metadata))
+    if not (msg.model or msg.cost_info or msg.response_time):
+        return
+    cost_info = msg.cost_info
+    metadata = _format_metadata(
+        msg.model,
+        cost_info.total_cost if cost_info else None,
+        cost_info.token_usage["total"] if cost_info else None,
+        msg.response_time,
+    )
+    container.markdown("---")
+    container.markdown(metadata)
 
 
 def chatmessage_view(
@@ -71,7 +92,7 @@ def chatmessage_view(
 
 
 if __name__ == "__main__":
-    from llmling_agent import ToolCallInfo
+    from llmling_agent import ChatMessage, ToolCallInfo
 
     from utils import run
 
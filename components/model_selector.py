@@ -16,6 +16,35 @@ if TYPE_CHECKING:
     from tokonomics.model_discovery import ModelInfo, ProviderType
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_models(providers: tuple[ProviderType, ...] | None) -> list[ModelInfo]:
+    """Fetch all models for the given providers, cached across reruns."""
+    from tokonomics.model_discovery import get_all_models_sync
+
+    return get_all_models_sync(providers=list(providers) if providers else None)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _available_providers(providers: tuple[ProviderType, ...] | None) -> list[str]:
+    """Get the sorted unique providers of all fetched models."""
+    return sorted({model.provider for model in _cached_models(providers)})
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _provider_models(
+    providers: tuple[ProviderType, ...] | None,
+    selected_provider: str,
+) -> list[ModelInfo]:
+    """Get all fetched models of the selected provider."""
+    return [m for m in _cached_models(providers) if m.provider == selected_provider]
+
+
+@st.cache_data(show_spinner=False)
+def _format_model(pydantic_ai_id: str, _model: ModelInfo) -> str:
+    """Format model details as markdown, cached by model id."""
+    return _model.format()
+
+
 def model_selector(
     *,
     agent: AnyAgent[Any, Any],
@@ -35,13 +64,12 @@ def model_selector(
     Returns:
         Selected model info or None if not selected
     """
-    # Fetch models
-    from tokonomics.model_discovery import get_all_models_sync
-
-    models = get_all_models_sync(providers=providers)
+    # Fetch models (hashable key for st.cache_data)
+    provider_key = tuple(providers) if providers else None
+    models = _cached_models(provider_key)
 
     # Get unique providers from models
-    available_providers = sorted({model.provider for model in models})
+    available_providers = _available_providers(provider_key)
 
     # Get current model info to set initial selections
     current_model_id = agent.model_name
@@ -74,7 +102,7 @@ def model_selector(
         selected_provider = available_providers[0]
 
     # Filter models by selected provider
-    provider_models = [m for m in models if m.provider == selected_provider]
+    provider_models = _provider_models(provider_key, selected_provider)
     model_names = [m.name for m in provider_models]
 
     # Determine initial model index
@@ -101,7 +129,7 @@ def model_selector(
     # Show model details in expander
     if selected_model:
         with st.expander("Model Details", expanded=expanded):
-            st.markdown(selected_model.format())
+            st.markdown(_format_model(selected_model.pydantic_ai_id, selected_model))
 
         # Update agent model if it changed
         if selected_model.pydantic_ai_id != current_model_id:
@@ -10,10 +10,42 @@ from components.model_selector import model_selector
 
 
 if TYPE_CHECKING:
-    from llmling_agent import AnyAgent
+    from collections.abc import Callable
+
+    from llmling_agent import AnyAgent, Tool
     from streamlit.delta_generator import DeltaGenerator
     from tokonomics.model_discovery import ModelInfo
 
+    from components.multi_select import MultiSelectItem
+
+
+@st.cache_resource
+def _available_tools() -> list[MultiSelectItem[Callable[[], Tool]]]:
+    """Get the selectable tools, built once per process.
+
+    Items hold the lazy tool accessors, so tools only get created once selected.
+    """
+    from components.multi_select import MultiSelectItem
+    from config import create_issue_tool, search_jira_tool, search_tool
+
+    return [
+        MultiSelectItem(
+            label="Web Search",
+            value=search_tool,
+            description="Search the web for information",
+        ),
+        MultiSelectItem(
+            label="Jira Search",
+            value=search_jira_tool,
+            description="Search for issues in Jira",
+        ),
+        MultiSelectItem(
+            label="Jira Create Issue",
+            value=create_issue_tool,
+            description="Create a new issue in Jira",
+        ),
+    ]
+
 
 def render_agent_config(
     agent: AnyAgent[Any, Any],
@@ -65,44 +97,34 @@ def render_tool_selector(agent: AnyAgent[Any, Any]) -> None:
     Args:
         agent: The agent for which to configure tools
     """
-    from components.multi_select import MultiSelectItem, managed_multiselect
+    from components.multi_select import managed_multiselect
     from components.state import state
-    from config import create_issue_tool, search_jira_tool, search_tool
-
-    # Define available tools as MultiSelectItems
-    available_tools = [
-        MultiSelectItem(
-            label="Web Search",
-            value=search_tool,
-            description="Search the web for information",
-        ),
-        MultiSelectItem(
-            label="Jira Search",
-            value=search_jira_tool,
-            description="Search for issues in Jira",
-        ),
-        MultiSelectItem(
-            label="Jira Create Issue",
-            value=create_issue_tool,
-            description="Create a new issue in Jira",
-        ),
-    ]
 
     # Use managed_multiselect for tool selection
     selected_items = managed_multiselect(
         "Available Tools",
-        available_tools,
+        _available_tools(),
         state_key=f"tools_{agent.name}",
         help_text="Select tools the agent can use",
     )
 
-    # Get the actual Tool objects from selected items
-    selected_tools = [item.value for item in selected_items]
+    # Get the actual Tool objects from selected items (created on first use)
+    selected_tools = [item.value() for item in selected_items]
+
+    # Only touch the agent's tools if the selection actually changed
+    previous_tools = state.agent_tools[agent.name]
+    previous_ids = {id(tool) for tool in previous_tools}
+    selected_ids = {id(tool) for tool in selected_tools}
+    if previous_ids == selected_ids:
+        return
 
     # Store in state
     state.agent_tools[agent.name] = selected_tools
 
-    # Update agent's tools
-    agent.tools.clear()  # Remove all existing tools
+    # Update agent's tools incrementally
+    for tool in previous_tools:
+        if id(tool) not in selected_ids:
+            del agent.tools[tool.name]
     for tool in selected_tools:
-        agent.tools.register_tool(tool)
+        if id(tool) not in previous_ids:
+            agent.tools.register_tool(tool)
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from llmling_agent import Agent, AnyAgent, ChatMessage, StructuredAgent
 import streamlit as st
 
 from config import FormData
 
 
+if TYPE_CHECKING:
+    from llmling_agent import Agent, AnyAgent, ChatMessage, StructuredAgent
+
+
 CHAT_AGENT_SYS_PROMPT = """\
 Du bist Uschi. Dein Umgangston ist sehr ruppig. Du bist dafür verantwortlich, möglichst unfreundlich
 dem User beim Bewältigen seiner Aufgaben zu helfen.
@@ -21,16 +24,45 @@ Du bist verantwortllich, Tickets im Jira-TicketSystem zu erstellen.
 Extrahiere Informationen aus dem dir gegebenen Chatverlauf.
 """
 
+SUMMARY_SYS_PROMPT = """\
+Fasse den dir gegebenen Chatverlauf knapp zusammen.
+Behalte alle Informationen bei, die für ein Ticket relevant sein könnten.
+"""
+
 MODEL_NAME = "openrouter:openai/gpt-4o-mini"
 CHAT_AGENT_NAME = "Dieter"
 FORM_AGENT_NAME = "Uschi"
+SUMMARY_AGENT_NAME = "Klaus"
+INITIALIZED_KEY = "_aistack_initialized"
 
 
 class State:
     """Session state management."""
 
+    @property
+    def initialized(self) -> bool:
+        """Whether the session state has already been initialized."""
+        return st.session_state.get(INITIALIZED_KEY, False)
+
+    def _init_sync(self) -> None:
+        """Initialize all session state entries which don't need awaiting."""
+        st.session_state.setdefault(
+            "form_data", {field: "" for field in FormData.model_fields}
+        )
+        st.session_state.setdefault("messages", defaultdict(dict))
+        st.session_state.setdefault("chat_text_cache", {})
+        st.session_state.setdefault("history_summaries", {})
+        st.session_state.setdefault("ticket_cache", {})
+        st.session_state.setdefault("agent_tools", defaultdict(list))
+
     async def initialize(self) -> None:
         """Initialize all agents."""
+        if self.initialized:
+            return
+        from llmling_agent import Agent
+
+        self._init_sync()
+
         if "agents" not in st.session_state:
             # Initialize form agent
             form_agent: StructuredAgent[None, FormData] = Agent(
@@ -55,26 +87,44 @@ class State:
                 chat_agent.name: chat_agent,
             }
 
-        if "form_data" not in st.session_state:
-            st.session_state.form_data = {field: "" for field in FormData.model_fields}
-
-        if "messages" not in st.session_state:
-            st.session_state.messages = defaultdict(list)
-        if "agent_tools" not in st.session_state:
-            st.session_state.agent_tools = defaultdict(list)
+        st.session_state[INITIALIZED_KEY] = True
 
     @property
-    def messages(self) -> defaultdict[str, list[ChatMessage[Any]]]:
-        """Get all agent messages, indexed by agent name."""
+    def messages(self) -> defaultdict[str, dict[str, ChatMessage[Any]]]:
+        """Get all agent messages, indexed by agent name and message id."""
         return st.session_state.messages
 
+    @property
+    def chat_text_cache(self) -> dict[str, tuple[tuple[str, ...], str]]:
+        """Get formatted chat histories as (message ids, text), by agent name."""
+        return st.session_state.chat_text_cache
+
+    @property
+    def history_summaries(self) -> dict[tuple[str, ...], str]:
+        """Get cached chat history summaries, keyed by the summarized message ids."""
+        return st.session_state.history_summaries
+
+    @property
+    def ticket_cache(self) -> dict[tuple[tuple[str, ...], ...], FormData]:
+        """Get generated tickets, keyed by agent configuration and chat message ids."""
+        return st.session_state.ticket_cache
+
     @property
     def agent_tools(self):
         return st.session_state.agent_tools
 
+    def add_message(self, agent_name: str, msg: ChatMessage[Any]) -> None:
+        """Add a message to an agent's history, replacing one with the same id."""
+        messages = self.messages[agent_name]
+        if msg.message_id in messages:
+            # The formatted history still contains the replaced message
+            self.chat_text_cache.pop(agent_name, None)
+        messages[msg.message_id] = msg
+
     def clear_agent_messages(self, agent_name: str) -> None:
         """Clear messages for a specific agent."""
-        self.messages[agent_name] = []
+        self.messages[agent_name] = {}
+        self.chat_text_cache.pop(agent_name, None)
 
     @property
     def agents(self) -> dict[str, AnyAgent[Any, Any]]:
@@ -91,6 +141,25 @@ class State:
         """Get the session's chat agent."""
         return st.session_state.agents[CHAT_AGENT_NAME]
 
+    async def get_summary_agent(self) -> Agent[None]:
+        """Get the session's chat history summary agent.
+
+        Most chats never get long enough to be summarized, so the agent is only
+        created on first use.
+        """
+        if (summary_agent := self.agents.get(SUMMARY_AGENT_NAME)) is None:
+            from llmling_agent import Agent
+
+            summary_agent = Agent[None](
+                name=SUMMARY_AGENT_NAME,
+                model=MODEL_NAME,
+                system_prompt=SUMMARY_SYS_PROMPT,
+                session=False,
+            )
+            await summary_agent.__aenter__()
+            self.agents[SUMMARY_AGENT_NAME] = summary_agent
+        return summary_agent
+
     @property
     def form_data(self) -> dict[str, str]:
         """Get the current form data."""
@@ -104,7 +173,7 @@ class State:
     @property
     def chat_messages(self) -> list[ChatMessage[Any]]:
         """Get the chat message history for the default chat agent."""
-        return self.messages[CHAT_AGENT_NAME]
+        return list(self.messages[CHAT_AGENT_NAME].values())
 
     @property
     def completed_form(self) -> FormData:
@@ -2,15 +2,41 @@
 
 from __future__ import annotations
 
-from llmling_agent import Tool
-from llmling_agent_tools import serper_search
-from llmling_agent_tools.jira_tool import jira_tools
+from functools import cache
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, ConfigDict
 
 
-search_tool = Tool.from_callable(serper_search.SerperTool().search)
-create_issue_tool = Tool.from_callable(jira_tools.create_issue)
-search_jira_tool = Tool.from_callable(jira_tools.search_for_issues)
+if TYPE_CHECKING:
+    from llmling_agent import Tool
+
+
+@cache
+def search_tool() -> Tool:
+    """Get the web search tool, created on first use."""
+    from llmling_agent import Tool
+    from llmling_agent_tools import serper_search
+
+    return Tool.from_callable(serper_search.SerperTool().search)
+
+
+@cache
+def create_issue_tool() -> Tool:
+    """Get the Jira issue creation tool, created on first use."""
+    from llmling_agent import Tool
+    from llmling_agent_tools.jira_tool import jira_tools
+
+    return Tool.from_callable(jira_tools.create_issue)
+
+
+@cache
+def search_jira_tool() -> Tool:
+    """Get the Jira issue search tool, created on first use."""
+    from llmling_agent import Tool
+    from llmling_agent_tools.jira_tool import jira_tools
+
+    return Tool.from_callable(jira_tools.search_for_issues)
 
 
 class FormData(BaseModel):
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING
 
-from llmling_agent import ChatMessage
 import streamlit as st
 
 from components.chat_view import render_tool_call
@@ -17,26 +16,21 @@ if TYPE_CHECKING:
     from llmling_agent.tools.tool_call_info import ToolCallInfo
 
 
-async def main_async() -> None:
-    """Async main function for the chat interface."""
-    # Action buttons
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("Ticket erstellen", use_container_width=True):
-            st.switch_page("pages/step2.py")
+TOOL_RENDER_KEY = "_tool_render_registered"
 
-    with col2:
-        if st.button("Neue Unterhaltung", use_container_width=True):
-            # Clear chat history for now (NOOP otherwise)
-            state.clear_agent_messages(state.chat_agent.name)
-            st.rerun()  # Refresh the page to show empty chat
 
-    await state.initialize()
-    st.title("🤖 EU-AI Act Analyse Tool - Chat")
+def render_tool_used(call: ToolCallInfo) -> None:
+    """Render a tool call of the chat agent into the active container."""
+    render_tool_call(st, call)
 
-    # Configure the chat agent
+
+@st.fragment
+def render_chat() -> None:
+    """Render the chat history and input.
+
+    Runs as a fragment, so chatting only reruns this part of the page.
+    """
     chat_agent = state.chat_agent
-    render_agent_sidebar(chat_agent)
 
     # Display chat history
     for message in state.chat_messages:
@@ -47,9 +41,11 @@ async def main_async() -> None:
 
     # Chat input
     if prompt := st.chat_input("Ihre Frage..."):
+        from llmling_agent import ChatMessage
+
         # Add user message to chat history
         chat_message = ChatMessage(content=prompt, role="user")
-        state.chat_messages.append(chat_message)
+        state.add_message(chat_agent.name, chat_message)
 
         # Display user message
         with st.chat_message("user"):
@@ -59,15 +55,9 @@ async def main_async() -> None:
             with st.chat_message("assistant"):
                 # Stream the response
                 with st.spinner("Denke nach..."):
-
-                    def render(call: ToolCallInfo):
-                        render_tool_call(st, call)
-
-                    chat_agent.tool_used.connect(render)
-                    full_response = await chat_agent.run(prompt)
+                    full_response = asyncio.run(chat_agent.run(prompt))
                     st.markdown(full_response.content)
-                    chat_agent.tool_used.disconnect(render)
-                state.chat_messages.append(full_response)
+                state.add_message(chat_agent.name, full_response)
 
         except Exception as e:  # noqa: BLE001
             error_msg = f"Ein Fehler ist aufgetreten: {e!s}"
@@ -76,7 +66,31 @@ async def main_async() -> None:
 
 def main() -> None:
     """Main entry point for the chat interface."""
-    asyncio.run(main_async())
+    # Action buttons
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Ticket erstellen", use_container_width=True):
+            st.switch_page("pages/step2.py")
+
+    with col2:
+        if st.button("Neue Unterhaltung", use_container_width=True):
+            # Clear chat history for now (NOOP otherwise)
+            state.clear_agent_messages(state.chat_agent.name)
+            st.rerun()  # Refresh the page to show empty chat
+
+    if not state.initialized:
+        asyncio.run(state.initialize())
+    st.title("🤖 EU-AI Act Analyse Tool - Chat")
+
+    # Render tool calls while the agent is running (connected once per session)
+    if not st.session_state.get(TOOL_RENDER_KEY):
+        state.chat_agent.tool_used.connect(render_tool_used)
+        st.session_state[TOOL_RENDER_KEY] = True
+
+    # Configure the chat agent
+    render_agent_sidebar(state.chat_agent)
+
+    render_chat()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ import streamlit as st
 
 from components.primitives import render_model_form
 from components.sidebar import render_agent_sidebar
-from components.state import state
+from components.state import CHAT_AGENT_NAME, state
 
 
 if TYPE_CHECKING:
@@ -18,13 +18,82 @@ if TYPE_CHECKING:
     from config import FormData
 
 
+# Longer chat histories get summarized before being sent to the form agent
+MAX_HISTORY_MESSAGES = 20
+MAX_HISTORY_CHARS = 8000
+HISTORY_HEAD = 2
+HISTORY_TAIL = 8
+
+
+def format_message(msg: ChatMessage) -> str:
+    """Format a single chat message for the ticket prompt."""
+    return f"{msg.role.upper()}: {msg.content}"
+
+
+def format_chat_history(
+    chat_messages: list[ChatMessage],
+    cache_key: str = CHAT_AGENT_NAME,
+) -> str:
+    """Format the chat history into a single text.
+
+    Only messages added since the last call get formatted, the already
+    formatted prefix is reused from the state's chat text cache as long as
+    its message ids are still the start of the history.
+    """
+    message_ids = tuple(msg.message_id for msg in chat_messages)
+    cached_ids, text = state.chat_text_cache.get(cache_key, ((), ""))
+    if message_ids[: len(cached_ids)] != cached_ids:
+        cached_ids, text = (), ""
+    if new_messages := chat_messages[len(cached_ids) :]:
+        new_text = "\n\n".join(format_message(msg) for msg in new_messages)
+        text = f"{text}\n\n{new_text}" if text else new_text
+    state.chat_text_cache[cache_key] = (message_ids, text)
+    return text
+
+
+async def summarize_messages(messages: list[ChatMessage]) -> str:
+    """Summarize the given messages, cached by their message ids."""
+    key = tuple(msg.message_id for msg in messages)
+    if (summary := state.history_summaries.get(key)) is None:
+        text = "\n\n".join(format_message(msg) for msg in messages)
+        summary_agent = await state.get_summary_agent()
+        result = await summary_agent.run(text)
+        summary = state.history_summaries[key] = str(result.content)
+    return summary
+
+
+def needs_summary(chat_messages: list[ChatMessage]) -> bool:
+    """Check whether the chat history is too long to be sent verbatim."""
+    if len(chat_messages) <= HISTORY_HEAD + HISTORY_TAIL:
+        return False
+    return (
+        len(chat_messages) > MAX_HISTORY_MESSAGES
+        or sum(len(str(msg.content)) for msg in chat_messages) > MAX_HISTORY_CHARS
+    )
+
+
 async def process_chat_history(
     agent: StructuredAgent[None, FormData],
     chat_messages: list[ChatMessage],
 ) -> FormData:
-    """Process the chat history and create a ticket summary."""
-    # Format chat history into a single text
-    chat_text = "\n\n".join(f"{msg.role.upper()}: {msg.content}" for msg in chat_messages)
+    """Process the chat history and create a ticket summary.
+
+    Long histories are windowed: the first and last messages are kept verbatim,
+    everything in between is replaced by a (cached) summary.
+    """
+    if needs_summary(chat_messages):
+        head = chat_messages[:HISTORY_HEAD]
+        middle = chat_messages[HISTORY_HEAD:-HISTORY_TAIL]
+        tail = chat_messages[-HISTORY_TAIL:]
+        summary = await summarize_messages(middle)
+        chat_text = "\n\n".join([
+            *(format_message(msg) for msg in head),
+            f"SUMMARY OF EARLIER MESSAGES: {summary}",
+            *(format_message(msg) for msg in tail),
+        ])
+    else:
+        # Format chat history into a single text
+        chat_text = format_chat_history(chat_messages)
 
     # Add instructions for ticket creation
     prompt = (
@@ -39,18 +108,35 @@ async def process_chat_history(
     return result.content  # This is a FormData instance
 
 
+def ticket_cache_key(
+    agent: StructuredAgent[None, FormData],
+    chat_messages: list[ChatMessage],
+) -> tuple[tuple[str, ...], ...]:
+    """Get the ticket cache key for the agent's configuration and chat history.
+
+    Covers everything the sidebar can change: model, system prompts and tools.
+    """
+    return (
+        (str(agent.model_name),),
+        tuple(str(prompt) for prompt in agent.sys_prompts.prompts),
+        tuple(sorted(tool.name for tool in state.agent_tools[agent.name])),
+        tuple(msg.message_id for msg in chat_messages),
+    )
+
+
 async def main_async() -> None:
     """Async main function for the ticket creation interface."""
     await state.initialize()
+
+    # Get chat history from the chat agent
+    chat_messages = state.chat_messages
+    ticket_creator = state.form_agent
+
     st.title("🎫 EU-AI Act Analyse Tool - Ticket erstellen")
 
     # Configure the agent
-    ticket_creator = state.form_agent
     render_agent_sidebar(ticket_creator)
 
-    # Get chat history from the chat agent
-    chat_messages = state.chat_messages
-
     if not chat_messages:
         st.warning(
             "Keine Chat-Nachrichten gefunden. Bitte führen Sie zuerst eine Unterhaltung."
@@ -59,9 +145,13 @@ async def main_async() -> None:
             st.switch_page("pages/step1.py")
         return
 
-    # Create ticket based on chat history
-    with st.spinner("Ticket wird erstellt..."):
-        ticket_data = await process_chat_history(ticket_creator, chat_messages)
+    # Create ticket based on chat history. The key is built after the sidebar,
+    # which may just have changed the agent's configuration
+    ticket_key = ticket_cache_key(ticket_creator, chat_messages)
+    if (ticket_data := state.ticket_cache.get(ticket_key)) is None:
+        with st.spinner("Ticket wird erstellt..."):
+            ticket_data = await process_chat_history(ticket_creator, chat_messages)
+        state.ticket_cache[ticket_key] = ticket_data
 
     # Display and edit the form
     st.subheader("Generiertes Ticket")
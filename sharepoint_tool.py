@@ -2,11 +2,45 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import asyncio
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import contextlib
+from functools import cache, cached_property, lru_cache
+from itertools import chain, islice
+import multiprocessing
+import os
+from pathlib import Path
+import queue
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal, get_args
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from langchain_core.document_loaders import BaseBlobParser
+    from langchain_core.documents.base import Blob, Document
+    from O365.drive import DriveItem
+    from O365.sharepoint import SharepointList, Site
+
+
+try:
+    from O365 import Account, MSGraphProtocol
+    from O365.drive import Folder
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError as e:
+    _O365_IMPORT_ERROR: ImportError | None = e
+    Account = MSGraphProtocol = Folder = None  # type: ignore[assignment,misc]
+    Session = HTTPAdapter = Retry = None  # type: ignore[assignment,misc]
+else:
+    _O365_IMPORT_ERROR = None
 
 
 # Scope Helper Literal type
@@ -38,6 +72,8 @@ ScopeHelper = Literal[
     "presence",
 ]
 
+_SCOPE_HELPERS: frozenset[str] = frozenset(get_args(ScopeHelper))
+
 
 MSGraphScope = Literal[
     # User scopes
@@ -76,6 +112,110 @@ MSGraphScope = Literal[
 ]
 
 
+# Microsoft Graph accepts at most 20 requests per JSON batch
+GRAPH_BATCH_SIZE = 20
+GRAPH_BATCH_PARALLELISM = 8
+GRAPH_BATCH_RETRIES = 3
+# Number of blobs downloaded ahead of the parsing stage
+PREFETCH_DEPTH = 8
+# Number of blobs downloaded concurrently
+DOWNLOAD_PARALLELISM = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Downloads larger than this are spooled to a temporary file instead of memory
+SPOOL_MAX_SIZE = 16 << 20
+# Maximum number of blobs being parsed (or waiting to be yielded) at once
+PARSE_MAX_IN_FLIGHT = 32
+EXTENDED_METADATA_FIELDS = "id,size,file,createdBy,lastModifiedBy"
+PERMISSION_FIELDS = "grantedToV2,grantedToIdentitiesV2"
+FOLDER_FIELDS = "id,name,folder,webUrl"
+CHILDREN_FIELDS = "id,name,file,folder,size,webUrl,@microsoft.graph.downloadUrl"
+# Maximum page size of the children endpoint
+CHILDREN_PAGE_SIZE = 999
+# Number of files whose metadata / permissions are cached per instance
+METADATA_CACHE_SIZE = 10_000
+# Connection pool shared by all Office365 instances
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _require_o365() -> None:
+    """Raise an ImportError if the O365 package is not installed."""
+    if _O365_IMPORT_ERROR is not None:
+        msg = "O365 package not found, please install it with `pip install o365`"
+        raise ImportError(msg) from _O365_IMPORT_ERROR
+
+
+@cache
+def _graph_protocol() -> MSGraphProtocol:
+    """Get the Graph protocol shared by all Office365 instances."""
+    return MSGraphProtocol()
+
+
+@cache
+def _http_adapter() -> HTTPAdapter:
+    """Get the connection pool shared by all Office365 instances."""
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=HTTP_RETRY_STATUSES)
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+@cache
+def _http_session() -> Session:
+    """Get the unauthenticated session used for the pre-authenticated downloads."""
+    session = Session()
+    session.mount("https://", _http_adapter())
+    return session
+
+
+# Scope helpers resolved to their atomic Graph scopes
+_HELPER_TO_SCOPES: dict[str, tuple[str, ...]] = {}
+
+
+def _refresh_scope_map() -> None:
+    """Resolve all scope helpers with a fresh Graph protocol."""
+    _graph_protocol.cache_clear()
+    protocol = _graph_protocol()
+    _HELPER_TO_SCOPES.update({
+        helper: tuple(protocol.get_scopes_for(helper)) for helper in _SCOPE_HELPERS
+    })
+
+
+if _O365_IMPORT_ERROR is None:
+    _refresh_scope_map()
+
+
+# Blob parser of a parsing worker process, sent once via the pool initializer
+_worker_parser: BaseBlobParser | None = None
+
+
+def _init_parse_worker(parser: BaseBlobParser) -> None:
+    """Store the blob parser in a parsing worker process."""
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_blob_worker(blob: Blob) -> list[Document]:
+    """Parse a blob into documents. Runs in a worker process."""
+    assert _worker_parser is not None
+    return list(_worker_parser.lazy_parse(blob))
+
+
+def _parse_extended_metadata(data: dict[str, Any]) -> dict[str, Any]:
+    """Extract the extended metadata from a drive item response."""
+    created_by = data.get("createdBy", {}).get("user", {})
+    modified_by = data.get("lastModifiedBy", {}).get("user", {})
+    return {
+        "size": data.get("size", 0),
+        "mime_type": data.get("file", {}).get("mimeType", ""),
+        "created_by": created_by.get("displayName", ""),
+        "modified_by": modified_by.get("displayName", ""),
+    }
+
+
 class Office365:
     """Office365 class for interacting with Microsoft Graph API."""
 
@@ -85,130 +225,586 @@ class Office365:
         client_secret: str,
         scopes: list[ScopeHelper],
         document_library_id: str,
+        blob_parser: BaseBlobParser,
         path: str | None = None,
     ):
-        from O365 import Account, MSGraphProtocol
-        from O365.drive import Drive
-
+        if invalid := set(scopes) - _SCOPE_HELPERS:
+            msg = f"Unknown scope helpers: {', '.join(sorted(invalid))}"
+            raise ValueError(msg)
+        _require_o365()
         self.client_id = client_id
         self.client_secret = client_secret
-        self.proto = MSGraphProtocol()
+        # Sent once to every parsing worker process, so it must be picklable
+        self._blob_parser = blob_parser
+        self.proto = _graph_protocol()
         self.load_extended_metadata = False
         self.load_auth = False
+        self.batch_parallelism = GRAPH_BATCH_PARALLELISM
+        self.prefetch_depth = PREFETCH_DEPTH
+        self.download_parallelism = DOWNLOAD_PARALLELISM
+        self._pool: ProcessPoolExecutor | None = None
+        self._metadata_cache: dict[str, dict[str, Any]] = {}
+        self._spool_paths: set[str] = set()
+        self.authorized_identities = lru_cache(  # type: ignore[method-assign]
+            maxsize=METADATA_CACHE_SIZE
+        )(self.authorized_identities)
         self.folder_path = path
+        self.folder_id: str | None = None
+        self.object_ids: tuple[str, ...] = ()
         # helpers to atomic scopes
-        ls = [self.proto.get_scopes_for(s) for sh in scopes for s in sh]
-        self.account = Account((client_id, client_secret))
+        ls = list(chain.from_iterable(_HELPER_TO_SCOPES[sh] for sh in scopes))
+        # The downloads and $batch posts are already throttled by their thread pools
+        # (and Retry-After), the connection's default per-request delay would only
+        # serialize them into bursts
+        self.account = Account((client_id, client_secret), requests_delay=0)
         if (
             not self.account.is_authenticated
             and self.account.authenticate(requested_scopes=ls) is False  # or scopes?
         ):
             msg = "Authentication Failed"
             raise RuntimeError(msg)
+        # Reuse keep-alive connections across instances
+        connection = self.account.connection
+        connection.naive_session = _http_session()
+        if connection.session is None:
+            connection.session = connection.get_session(load_token=True)
+        connection.session.mount("https://", _http_adapter())
         self.site = self.account.sharepoint().get_site("root", "path/tosite")
         assert self.site
-        self.subsites = self.site.get_subsites()
-        self.lists = self.site.get_lists()
-        ls = self.site.get_list_by_name("list_name")
         self.document_library_id = document_library_id
         drive = self.account.storage().get_drive(document_library_id)
-        assert drive
-        self.drive = drive
-        if not isinstance(self.drive, Drive):
+        if drive is None:
             msg = f"There isn't a Drive with id {self.document_library_id}."
-            raise ValueError(msg)  # noqa: TRY004
+            raise ValueError(msg)
+        self.drive = drive
 
-    def lazy_load(self) -> Iterator[Document]:
-        """Load documents lazily. Use this when working at a large scale.
+    @cached_property
+    def subsites(self) -> list[Site]:
+        """Get the subsites of the site, fetched on first access."""
+        return self.site.get_subsites()
 
-        Yields:
-            Document: A document object representing the parsed blob.
+    @cached_property
+    def lists(self) -> list[SharepointList]:
+        """Get the lists of the site, fetched on first access."""
+        return self.site.get_lists()
+
+    def get_list(self, name: str) -> SharepointList:
+        """Get a list of the site by its name."""
+        return self.site.get_list_by_name(name)
+
+    def _item_url(self, file_id: str) -> str:
+        """Get the Graph URL of a drive item, relative to the service root."""
+        return (
+            f"/drives/{self.document_library_id}/items/{file_id}"
+            f"?$select={EXTENDED_METADATA_FIELDS}"
+        )
+
+    def _cache_metadata(self, file_id: str, metadata: dict[str, Any]) -> None:
+        """Cache the extended metadata of a file, evicting the oldest entry if full."""
+        if len(self._metadata_cache) >= METADATA_CACHE_SIZE:
+            del self._metadata_cache[next(iter(self._metadata_cache))]
+        self._metadata_cache[file_id] = metadata
+
+    def refresh_metadata_cache(self) -> None:
+        """Drop all cached extended metadata and authorized identities."""
+        self._metadata_cache.clear()
+        self.authorized_identities.cache_clear()  # type: ignore[attr-defined]
+
+    def get_extended_metadata(self, file_id: str) -> dict[str, Any]:
+        """Fetch the extended metadata of a single file (cached by file id)."""
+        if (metadata := self._metadata_cache.get(file_id)) is None:
+            url = f"{self.proto.service_url.rstrip('/')}{self._item_url(file_id)}"
+            response = self.account.connection.get(url)
+            metadata = _parse_extended_metadata(response.json())
+            self._cache_metadata(file_id, metadata)
+        return dict(metadata)
+
+    def authorized_identities(self, file_id: str) -> list[str]:
+        """Fetch the ids of all users and groups with access to a file."""
+        url = (
+            f"{self.proto.service_url}drives/{self.document_library_id}"
+            f"/items/{file_id}/permissions"
+        )
+        response = self.account.connection.get(url, params={"$select": PERMISSION_FIELDS})
+        identities: list[str] = []
+        for permission in response.json().get("value", []):
+            granted = [
+                *permission.get("grantedToIdentitiesV2", []),
+                *([permission["grantedToV2"]] if "grantedToV2" in permission else []),
+            ]
+            identities.extend(
+                entity_id
+                for identity in granted
+                for kind in ("user", "group")
+                if (entity_id := identity.get(kind, {}).get("id")) is not None
+            )
+        return identities
+
+    def _post_batch(self, requests: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Post a single $batch request, retrying throttled sub-requests.
+
+        Sub-requests answered with 429 are retried after their Retry-After delay.
+
+        Returns:
+            The sub-responses, keyed by request id.
+        """
+        url = f"{self.proto.service_url}$batch"
+        responses: dict[str, dict[str, Any]] = {}
+        pending = requests
+        for attempt in range(GRAPH_BATCH_RETRIES):
+            response = self.account.connection.post(url, data={"requests": pending})
+            throttled: set[str] = set()
+            retry_after = 0
+            for sub_response in response.json().get("responses", []):
+                if sub_response.get("status") == 429:  # noqa: PLR2004
+                    throttled.add(sub_response["id"])
+                    delay = sub_response.get("headers", {}).get("Retry-After", 1)
+                    retry_after = max(retry_after, int(delay))
+                else:
+                    responses[sub_response["id"]] = sub_response
+            if not throttled or attempt == GRAPH_BATCH_RETRIES - 1:
+                break
+            time.sleep(retry_after)
+            pending = [request for request in pending if request["id"] in throttled]
+        return responses
+
+    def _dispatch_batches(
+        self, requests: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Split requests into $batch chunks of 20 and post them concurrently.
+
+        Returns:
+            The sub-responses of all chunks, keyed by request id.
+        """
+        chunks = [
+            requests[i : i + GRAPH_BATCH_SIZE]
+            for i in range(0, len(requests), GRAPH_BATCH_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return self._post_batch(requests) if requests else {}
+        responses: dict[str, dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.batch_parallelism) as pool:
+            for chunk_responses in pool.map(self._post_batch, chunks):
+                responses.update(chunk_responses)
+        return responses
+
+    def _batch_extended_metadata(self, file_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch the extended metadata of the given files with $batch requests.
+
+        Only files missing from the metadata cache are requested.
+
+        Returns:
+            The extended metadata, keyed by file id.
+        """
+        missing = [file_id for file_id in file_ids if file_id not in self._metadata_cache]
+        requests = [
+            {"id": str(i), "method": "GET", "url": self._item_url(file_id)}
+            for i, file_id in enumerate(missing)
+        ]
+        responses = self._dispatch_batches(requests)
+        for i, file_id in enumerate(missing):
+            sub_response = responses.get(str(i), {})
+            if sub_response.get("status") == 200:  # noqa: PLR2004
+                metadata = _parse_extended_metadata(sub_response["body"])
+                self._cache_metadata(file_id, metadata)
+        # Files whose sub-request failed fall back to a single request
+        return {file_id: self.get_extended_metadata(file_id) for file_id in file_ids}
+
+    def _get_drive_item(self, path: str) -> DriveItem:
+        """Fetch a drive item, selecting only the fields needed to walk folders.
+
+        Args:
+            path: The item path relative to the drive, e.g. "root" or "items/{id}"
+        """
+        url = f"{self.proto.service_url}drives/{self.document_library_id}/{path}"
+        response = self.account.connection.get(url, params={"$select": FOLDER_FIELDS})
+        data = response.json()
+        item_cls = self.drive._classifier(data)
+        return item_cls(parent=self.drive, **{self.drive._cloud_data_key: data})
+
+    def _iter_children(self, folder_id: str) -> Iterator[dict[str, Any]]:
+        """Iterate the children of a folder, following the @odata.nextLink pages."""
+        url: str | None = (
+            f"{self.proto.service_url}drives/{self.document_library_id}"
+            f"/items/{folder_id}/children"
+        )
+        params: dict[str, Any] | None = {
+            "$top": CHILDREN_PAGE_SIZE,
+            "$select": CHILDREN_FIELDS,
+        }
+        while url:
+            data = self.account.connection.get(url, params=params).json()
+            yield from data.get("value", [])
+            url = data.get("@odata.nextLink")
+            params = None  # The next link already contains the query
+
+    def _download_blob(self, item: dict[str, Any]) -> Blob:
+        """Download a drive item via its pre-authenticated download URL.
+
+        The download is streamed; files larger than SPOOL_MAX_SIZE are spooled to
+        a temporary file, which is removed again once the blob is parsed.
         """
         try:
-            from O365.drive import Drive, Folder
+            from langchain_core.documents.base import Blob
         except ImportError:
-            msg = "O365 package not found, please install it with `pip install o365`"
+            msg = (
+                "langchain-core package not found, "
+                "please install it with `pip install langchain-core`"
+            )
             raise ImportError(msg)  # noqa: B904
 
+        mime_type = item["file"].get("mimeType")
+        metadata = {
+            "id": item["id"],
+            "name": item["name"],
+            "size": item.get("size", 0),
+            "source": item.get("webUrl", ""),
+        }
+        download_url = item["@microsoft.graph.downloadUrl"]
+        response = self.account.connection.naive_request(download_url, "get", stream=True)
+        with response:
+            chunks: list[bytes] = []
+            size = 0
+            content = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+            for chunk in content:
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > SPOOL_MAX_SIZE:
+                    break
+            else:
+                data = b"".join(chunks)
+                return Blob.from_data(
+                    data, mime_type=mime_type, path=item["name"], metadata=metadata
+                )
+            # Too large to keep in memory, spool the rest to disk
+            suffix = Path(item["name"]).suffix
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as spool:
+                self._spool_paths.add(spool.name)
+                try:
+                    spool.writelines(chunks)
+                    chunks.clear()
+                    for chunk in content:
+                        spool.write(chunk)
+                except BaseException:
+                    spool.close()
+                    self._remove_spool_file(spool.name)
+                    raise
+        return Blob.from_path(spool.name, mime_type=mime_type, metadata=metadata)
+
+    def _download_blobs(
+        self, items: Iterable[tuple[dict[str, Any], dict[str, Any]]]
+    ) -> Iterator[tuple[Blob, dict[str, Any]]]:
+        """Download drive items concurrently, yielding blobs in input order.
+
+        Up to download_parallelism downloads are in flight at once.
+
+        Args:
+            items: The drive items to download, paired with their extended metadata
+        """
+        in_flight: deque[tuple[Future[Blob], dict[str, Any]]] = deque()
+        with ThreadPoolExecutor(max_workers=self.download_parallelism) as pool:
+            try:
+                for item, metadata in items:
+                    in_flight.append((pool.submit(self._download_blob, item), metadata))
+                    if len(in_flight) >= self.download_parallelism:
+                        future, metadata = in_flight.popleft()
+                        yield future.result(), metadata
+                while in_flight:
+                    future, metadata = in_flight.popleft()
+                    yield future.result(), metadata
+            finally:
+                for future, _ in in_flight:
+                    future.cancel()
+
+    def _load_from_folder(self, folder: Folder) -> Iterator[dict[str, Any]]:
+        """Iterate the file items of a folder and its subfolders.
+
+        Folders are enumerated with the paged children endpoint (up to 999 items
+        per request), the items already contain everything needed to download
+        the files without any further item lookup.
+        """
+        folder_ids = [folder.object_id]
+        while folder_ids:
+            for item in self._iter_children(folder_ids.pop()):
+                if "folder" in item:
+                    folder_ids.append(item["id"])
+                elif "file" in item:
+                    yield item
+
+    def _load_from_object_ids(self, object_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Look up the file items with the given ids.
+
+        The items are looked up with $batch requests. Ids which do not exist
+        (404) or refer to a folder are skipped, other failed sub-requests fall
+        back to a single request, which raises if it fails again.
+        """
+        urls = [
+            f"/drives/{self.document_library_id}/items/{object_id}"
+            f"?$select={CHILDREN_FIELDS}"
+            for object_id in object_ids
+        ]
+        requests = [
+            {"id": str(i), "method": "GET", "url": url} for i, url in enumerate(urls)
+        ]
+        responses = self._dispatch_batches(requests)
+        items: list[dict[str, Any]] = []
+        for i, url in enumerate(urls):
+            sub_response = responses.get(str(i), {})
+            match sub_response.get("status"):
+                case 200:
+                    item = sub_response["body"]
+                case 404:
+                    continue
+                case _:
+                    service_url = self.proto.service_url.rstrip("/")
+                    item = self.account.connection.get(f"{service_url}{url}").json()
+            if "file" in item:
+                items.append(item)
+        return items
+
+    def _with_extended_metadata(
+        self, items: Iterable[dict[str, Any]]
+    ) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+        """Pair drive items with their extended metadata, fetched in $batch windows.
+
+        The metadata is fetched by item id before the files get downloaded, so
+        only the (small) item listings are buffered per window.
+        """
+        if not self.load_extended_metadata:
+            yield from ((item, {}) for item in items)
+            return
+        window_size = GRAPH_BATCH_SIZE * self.batch_parallelism
+        item_iter = iter(items)
+        while window := list(islice(item_iter, window_size)):
+            file_ids = [str(item["id"]) for item in window]
+            metadata = self._batch_extended_metadata(file_ids)
+            for item, file_id in zip(window, file_ids, strict=True):
+                yield item, metadata[file_id]
+
+    def _prefetch[T](self, items: Iterable[T]) -> Generator[T, None, None]:
+        """Iterate (and thereby download) blobs on a background thread.
+
+        Up to prefetch_depth blobs are kept ready, so downloading overlaps with
+        the parsing stage. Errors of the source are re-raised.
+        """
+        buffer: queue.Queue[tuple[T | None, BaseException | None]] = queue.Queue(
+            maxsize=self.prefetch_depth
+        )
+        stop = threading.Event()
+
+        def produce() -> None:
+            iterator = iter(items)
+            try:
+                for item in iterator:
+                    if stop.is_set():
+                        return
+                    buffer.put((item, None))
+            except Exception as e:  # noqa: BLE001
+                buffer.put((None, e))
+            finally:
+                # Let the source finish its cleanup (e.g. running downloads) here
+                if isinstance(iterator, Generator):
+                    iterator.close()
+                buffer.put((None, None))
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item, error = buffer.get()
+                if error is not None:
+                    raise error
+                if item is None:
+                    return
+                yield item
+        finally:
+            # Unblock the producer if the consumer stopped early
+            stop.set()
+            while thread.is_alive():
+                with contextlib.suppress(queue.Empty):
+                    buffer.get(timeout=0.1)
+
+    def _parse_blobs(
+        self, items: Iterable[tuple[Blob, dict[str, Any]]]
+    ) -> Generator[tuple[Blob, dict[str, Any], list[Document]], None, None]:
+        """Parse blobs in the process pool, yielding results in input order.
+
+        Up to PARSE_MAX_IN_FLIGHT blobs are parsed ahead of the consumer.
+        """
+        in_flight: deque[tuple[Blob, dict[str, Any], Future[list[Document]]]] = deque()
+        # Spawned workers don't inherit the download threads of this process
+        pool = self._pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(self._blob_parser,),
+        )
+        try:
+            for blob, metadata in items:
+                future = pool.submit(_parse_blob_worker, blob)
+                in_flight.append((blob, metadata, future))
+                if len(in_flight) >= PARSE_MAX_IN_FLIGHT:
+                    blob, metadata, future = in_flight.popleft()
+                    yield blob, metadata, self._parse_result(blob, future)
+            while in_flight:
+                blob, metadata, future = in_flight.popleft()
+                yield blob, metadata, self._parse_result(blob, future)
+        finally:
+            self._pool = None
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _parse_result(self, blob: Blob, future: Future[list[Document]]) -> list[Document]:
+        """Wait for the documents of a blob, removing its spool file afterwards."""
+        try:
+            return future.result()
+        finally:
+            if (path := str(blob.path)) in self._spool_paths:
+                self._remove_spool_file(path)
+
+    def _remove_spool_file(self, path: str) -> None:
+        """Remove a spool file of a downloaded blob."""
+        self._spool_paths.discard(path)
+        Path(path).unlink(missing_ok=True)
+
+    def _remove_spool_files(self) -> None:
+        """Remove the spool files of all blobs which did not get parsed."""
+        for path in list(self._spool_paths):
+            self._remove_spool_file(path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the parsing process pool of a running load, if any."""
+        if (pool := self._pool) is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+        self._remove_spool_files()
+
+    def _make_enricher(
+        self, folder: Folder | None = None
+    ) -> Callable[[Blob, dict[str, Any]], dict[str, Any]]:
+        """Build the function computing the document metadata of a blob.
+
+        The load flags are evaluated once here instead of for every document.
+
+        Args:
+            folder: The folder the blobs were loaded from, if any
+        """
+        source = {"source_full_url": folder.web_url} if folder is not None else {}
+
+        def enrich_none(blob: Blob, extended_metadata: dict[str, Any]) -> dict[str, Any]:
+            return blob.metadata
+
+        def enrich_auth(blob: Blob, extended_metadata: dict[str, Any]) -> dict[str, Any]:
+            identities = self.authorized_identities(str(blob.metadata.get("id")))
+            return {**blob.metadata, "authorized_identities": identities}
+
+        def enrich_ext(blob: Blob, extended_metadata: dict[str, Any]) -> dict[str, Any]:
+            return {**blob.metadata, **extended_metadata, **source}
+
+        def enrich_both(blob: Blob, extended_metadata: dict[str, Any]) -> dict[str, Any]:
+            return {**enrich_auth(blob, extended_metadata), **extended_metadata, **source}
+
+        match self.load_auth is True, self.load_extended_metadata is True:
+            case True, True:
+                return enrich_both
+            case True, False:
+                return enrich_auth
+            case False, True:
+                return enrich_ext
+            case _:
+                return enrich_none
+
+    def _yield_parsed(
+        self, items: Iterable[dict[str, Any]], folder: Folder | None = None
+    ) -> Iterator[Document]:
+        """Download, parse and enrich drive items, yielding the parsed documents.
+
+        Args:
+            items: The file items to load
+            folder: The folder the items were loaded from, if any
+        """
+        enrich = self._make_enricher(folder)
+        blobs = self._prefetch(self._download_blobs(self._with_extended_metadata(items)))
+        parsed = self._parse_blobs(blobs)
+        try:
+            for blob, extended_metadata, documents in parsed:
+                metadata = enrich(blob, extended_metadata)
+                for document in documents:
+                    document.metadata.update(metadata)
+                    yield document
+        finally:
+            # Stop all stages before removing the spool files of unparsed blobs
+            parsed.close()
+            blobs.close()
+            self._remove_spool_files()
+
+    def lazy_load(self) -> Generator[Document, None, None]:
+        """Load documents lazily. Use this when working at a large scale.
+
+        Yields:
+            Document: A document object representing the parsed blob.
+        """
+        _require_o365()
+        items: Iterable[dict[str, Any]]
         if self.folder_path:
-            target_folder = self.drive.get_item_by_path(self.folder_path)
+            path = self.folder_path
+            target_folder = self._get_drive_item(f"root:/{path.lstrip('/')}")
             if not isinstance(target_folder, Folder):
                 msg = f"There isn't a folder with path {self.folder_path}."
                 raise ValueError(msg)
-            for blob in self._load_from_folder(target_folder):
-                file_id = str(blob.metadata.get("id"))
-                # if self.load_auth is True:
-                #     auth_identities = self.authorized_identities(file_id)
-                if self.load_extended_metadata is True:
-                    extended_metadata = self.get_extended_metadata(file_id)
-                    extended_metadata.update({"source_full_url": target_folder.web_url})
-                for parsed_blob in self._blob_parser.lazy_parse(blob):
-                    if self.load_auth is True:
-                        parsed_blob.metadata["authorized_identities"] = auth_identities
-                    if self.load_extended_metadata is True:
-                        parsed_blob.metadata.update(extended_metadata)
-                    yield parsed_blob
-        if self.folder_id:
-            target_folder = drive.get_item(self.folder_id)
+            items = self._load_from_folder(target_folder)
+        elif self.folder_id:
+            target_folder = self._get_drive_item(f"items/{self.folder_id}")
             if not isinstance(target_folder, Folder):
-                msg = f"There isn't a folder with path {self.folder_path}."
+                msg = f"There isn't a folder with id {self.folder_id}."
                 raise ValueError(msg)
-            for blob in self._load_from_folder(target_folder):
-                file_id = str(blob.metadata.get("id"))
-                # if self.load_auth is True:
-                #     auth_identities = self.authorized_identities(file_id)
-                if self.load_extended_metadata is True:
-                    extended_metadata = self.get_extended_metadata(file_id)
-                    extended_metadata.update({"source_full_url": target_folder.web_url})
-                for parsed_blob in self._blob_parser.lazy_parse(blob):
-                    if self.load_auth is True:
-                        parsed_blob.metadata["authorized_identities"] = auth_identities
-                    if self.load_extended_metadata is True:
-                        parsed_blob.metadata.update(extended_metadata)
-                    yield parsed_blob
-        if self.object_ids:
-            for blob in self._load_from_object_ids(drive, self.object_ids):
-                file_id = str(blob.metadata.get("id"))
-                # if self.load_auth is True:
-                #     auth_identities = self.authorized_identities(file_id)
-                if self.load_extended_metadata is True:
-                    extended_metadata = self.get_extended_metadata(file_id)
-                for parsed_blob in self._blob_parser.lazy_parse(blob):
-                    if self.load_auth is True:
-                        parsed_blob.metadata["authorized_identities"] = auth_identities
-                    if self.load_extended_metadata is True:
-                        parsed_blob.metadata.update(extended_metadata)
-                    yield parsed_blob
-
-        if not (self.folder_path or self.folder_id or self.object_ids):
-            target_folder = drive.get_root_folder()
+            items = self._load_from_folder(target_folder)
+        elif self.object_ids:
+            target_folder = None
+            items = self._load_from_object_ids(self.object_ids)
+        else:
+            target_folder = self._get_drive_item("root")
             if not isinstance(target_folder, Folder):
                 msg = "Unable to fetch root folder"
                 raise ValueError(msg)
-            for blob in self._load_from_folder(target_folder):
-                file_id = str(blob.metadata.get("id"))
-                if self.load_auth is True:
-                    auth_identities = self.authorized_identities(file_id)
-                if self.load_extended_metadata is True:
-                    extended_metadata = self.get_extended_metadata(file_id)
-                for blob_part in self._blob_parser.lazy_parse(blob):
-                    blob_part.metadata.update(blob.metadata)
-                    if self.load_auth is True:
-                        blob_part.metadata["authorized_identities"] = auth_identities
-                    if self.load_extended_metadata is True:
-                        blob_part.metadata.update(extended_metadata)
-                        blob_part.metadata.update({
-                            "source_full_url": target_folder.web_url
-                        })
-                    yield blob_part
+            items = self._load_from_folder(target_folder)
+        yield from self._yield_parsed(items, folder=target_folder)
+
+    async def lazy_load_async(self) -> AsyncIterator[Document]:
+        """Load documents lazily without blocking the event loop.
+
+        The loading pipeline runs on a worker thread, documents are yielded as
+        soon as they are parsed.
+
+        Yields:
+            Document: A document object representing the parsed blob.
+        """
+        # All calls into the generator go through the same single worker, so it
+        # is only closed once a still running next() call has finished
+        worker = ThreadPoolExecutor(max_workers=1)
+        documents = self.lazy_load()
+        try:
+            while True:
+                future = worker.submit(next, documents, None)
+                document = await asyncio.wrap_future(future)
+                if document is None:
+                    return
+                yield document
+        finally:
+            try:
+                await asyncio.wrap_future(worker.submit(documents.close))
+            finally:
+                worker.shutdown(wait=False)
 
 
 if __name__ == "__main__":
+    # Needs langchain-community, any other BaseBlobParser works as well
+    from langchain_community.document_loaders.parsers.registry import get_parser
+
     office365 = Office365(
         client_id="your_client_id",
         client_secret="your_client_secret",
         scopes=["sharepoint"],
         document_library_id="test",
+        blob_parser=get_parser("default"),
     )
 
 
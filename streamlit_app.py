@@ -7,18 +7,7 @@ import sys
 import streamlit as st
 
 
-if sys.platform == "win32":
-    import asyncio
-    from asyncio import WindowsSelectorEventLoopPolicy
-
-    asyncio.set_event_loop_policy(WindowsSelectorEventLoopPolicy())
-
-
-def main() -> None:
-    """Render the welcome page."""
-    st.title("🤖 EU-AI Act Analyse Tool")
-
-    st.markdown("""
+WELCOME_MARKDOWN = """
     ## Willkommen!
 
     Dieses Tool hilft Ihnen dabei, Informationen im Kontext des EU-AI Acts zu
@@ -31,7 +20,30 @@ def main() -> None:
        weitere Fragen klären
 
     Klicken Sie auf 'Start', um zu beginnen.
-    """)
+    """
+
+
+def _ensure_event_loop_policy() -> None:
+    """Use the selector event loop on Windows, unless it is already in use.
+
+    Streamlit re-executes this script on every rerun, so the check is done on
+    the installed policy itself instead of a module-level flag.
+    """
+    if sys.platform == "win32":
+        import asyncio
+        from asyncio import WindowsSelectorEventLoopPolicy
+
+        policy = asyncio.get_event_loop_policy()
+        if not isinstance(policy, WindowsSelectorEventLoopPolicy):
+            asyncio.set_event_loop_policy(WindowsSelectorEventLoopPolicy())
+
+
+def main() -> None:
+    """Render the welcome page."""
+    _ensure_event_loop_policy()
+    st.title("🤖 EU-AI Act Analyse Tool")
+
+    st.markdown(WELCOME_MARKDOWN)
 
     if st.button("Start", use_container_width=True):
         st.switch_page("pages/step1.py")